@@ -1 +1,2 @@
 from .chain import *  # noqa
+from .mixture import *  # noqa
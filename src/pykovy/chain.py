@@ -1,11 +1,11 @@
-from collections import Counter, Mapping, MutableMapping
+from collections import Counter, Mapping, MutableMapping, defaultdict
 from itertools import chain
 from random import random
 from .errors import MarkovError, DisjointChainError, MarkovStateError
 from .utils import (
     window, weighted_choice_on_map,
     patch_return_type, random_key,
-    head, last, groupby
+    head, last, groupby, prefixes
 )
 
 __all__ = (
@@ -59,10 +59,15 @@ class MarkovChain(MutableMapping):
 
     States are keys stored as n-length tuples and possible states are values
     stored as ProbablityMap instances.
+
+    Every proper prefix of a stored state is indexed alongside it so states
+    can be looked up by their leading tokens without scanning the chain,
+    see :method:`MarkovChain.prefixed_states`
     """
 
     def __init__(self, order, states=None):
         self.data = {}
+        self._prefixes = defaultdict(set)
         self._order = order
         if states is not None:
             self.update(states)
@@ -91,7 +96,7 @@ class MarkovChain(MutableMapping):
         If optional arguments needs to be passed to iterator,
         use :method:`MarkovChain.iterate_chain`
         """
-        return MarkovChainIterator(chain=self.data)
+        return MarkovChainIterator(chain=self)
 
     def __setitem__(self, key, value):
         """Sets key-value pair on the MarkovChain and ensures type saftey
@@ -107,6 +112,14 @@ class MarkovChain(MutableMapping):
             value = ProbablityMap(value)
 
         self.data[key] = value
+        self._index_state(key)
+
+    def _index_state(self, key):
+        """Records the state under each of its prefixes.
+        """
+
+        for prefix in prefixes(key):
+            self._prefixes[prefix].add(key)
 
     def __getitem__(self, state):
         if not isinstance(state, tuple):
@@ -155,6 +168,34 @@ class MarkovChain(MutableMapping):
     def items(self):
         return self.data.items()
 
+    def prefixed_states(self, prefix):
+        """Returns a ProbablityMap of every state beginning with prefix,
+        valued by how often each state was seen.
+
+        A prefix as long as the chain's order matches only itself. If no
+        state begins with prefix, a MarkovStateError is raised.
+        """
+
+        if not isinstance(prefix, tuple):
+            prefix = (prefix,)
+
+        if len(prefix) == self.order and prefix in self.data:
+            return ProbablityMap({prefix: sum(self.data[prefix].values())})
+
+        # counts are read now rather than when indexed since the
+        # ProbablityMaps may be changed in place, and states removed
+        # through data.__delitem__ are skipped
+        states = ProbablityMap({
+            state: sum(self.data[state].values())
+            for state in self._prefixes.get(prefix, ())
+            if state in self.data
+        })
+
+        if not states:
+            raise MarkovStateError("No states begin with: {}".format(prefix))
+
+        return states
+
     @classmethod
     def from_corpus(cls, corpus, order, begin_with=None):
         """Allows building a Markov Chain from a corpus rather than
@@ -187,7 +228,7 @@ class MarkovChain(MutableMapping):
         MarkovChainIterator class for iteration.
         """
 
-        return MarkovChainIterator(chain=self.data, **kwargs)
+        return MarkovChainIterator(chain=self, **kwargs)
 
 
 class MarkovChainIterator(object):
@@ -207,7 +248,8 @@ class MarkovChainIterator(object):
         * chain: MarkovChain or subclass to iterate
         * randomizer: callable that returns floats 0 < n < 1,
         defaults to :func:`~random.random`
-        * begin_at: known state to place the iterator in
+        * begin_at: known state to place the iterator in, or a prefix of
+        one if chain provides prefixed_states
         * randomizer: function to generate floats 0 <= n < 1
         defaults to random.random
         """
@@ -216,6 +258,8 @@ class MarkovChainIterator(object):
         self._state = self._possible = None
         self._randomizer = randomizer
         self._chain = self._build_chain(chain)
+        self._prefixed_states = self._build_prefixed_states(chain)
+        self._prefix_choosers = {}
 
         if begin_at:
             self._set_state(begin_at)
@@ -228,7 +272,7 @@ class MarkovChainIterator(object):
         Useful for reusing the same iterator multiple times without having
         to rebuild every weighted random chooser.
 
-        * begin_at: known state to place the iterator in
+        * begin_at: known state, or prefix of one, to place the iterator in
         """
         self._invalid = False
         self._state = self._possible = None
@@ -239,14 +283,57 @@ class MarkovChainIterator(object):
             self._random_state()
 
     def _set_state(self, begin_at=None):
-        """Attempts to place iterator into a known state and falls back
-        to a random state if the known state isn't possible.
+        """Attempts to place iterator into a known state. If that state
+        isn't possible, a state beginning with begin_at is chosen instead,
+        weighted by how often each was seen. Falls back to a random state
+        if neither is possible.
         """
 
         try:
             self.state = begin_at
         except MarkovStateError:
-            self._random_state()
+            try:
+                self.state = self._prefixed_state(begin_at)
+            except MarkovStateError:
+                self._random_state()
+
+    def _prefixed_state(self, prefix):
+        """Chooses a state beginning with prefix.
+
+        Choosers are built the first time a prefix is asked for and reused
+        afterwards. Counts are read from the chain at that point, but only
+        states in the iterator's copy of the chain are considered. Raises a
+        MarkovStateError if the chain can't be searched by prefix or no
+        known state begins with it.
+        """
+
+        if self._prefixed_states is None:
+            raise MarkovStateError("Chain does not support prefixed states")
+
+        if not isinstance(prefix, tuple):
+            prefix = (prefix,)
+
+        if prefix not in self._prefix_choosers:
+            # the chain may have gained states since it was copied
+            states = ProbablityMap({
+                state: mass
+                for state, mass in self._prefixed_states(prefix).items()
+                if state in self._chain
+            })
+
+            if not states:
+                raise MarkovStateError("No known states begin with: {}".format(prefix))
+
+            self._prefix_choosers[prefix] = states.weighted_choice(self._randomizer)
+
+        return self._prefix_choosers[prefix]()
+
+    def _build_prefixed_states(self, chain):
+        """Returns the callable used to look up states by prefix, or None
+        if chain can't be searched that way.
+        """
+
+        return getattr(chain, 'prefixed_states', None)
 
     def _build_chain(self, chain):
         """Builds map of states and weighted random
@@ -255,7 +342,7 @@ class MarkovChainIterator(object):
 
         return {
             state: chain[state].weighted_choice(self._randomizer)
-            for state in chain
+            for state in chain.keys()
         }
 
     def _random_state(self):
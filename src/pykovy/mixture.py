@@ -0,0 +1,308 @@
+from collections import OrderedDict
+from random import random
+from .chain import MarkovChain, MarkovChainIterator, ProbablityMap
+from .errors import MarkovError, MarkovStateError
+from .utils import weighted_choice, random_key, unzip
+
+__all__ = (
+    "MixtureChain", "MixtureChainIterator"
+)
+
+
+def _combine(weighted_maps):
+    """Sums (ProbablityMap, weight) pairs into a single ProbablityMap,
+    scaling each map's counts by its weight.
+    """
+
+    combined = ProbablityMap()
+    for possible, weight in weighted_maps:
+        for value, count in possible.items():
+            combined[value] += weight * count
+    return combined
+
+
+def _prefixed_states(weighted_chains, prefix):
+    """Combines every chain's states beginning with prefix, scaled by
+    the chain's weight. Raises a MarkovStateError if none have any.
+    """
+
+    weighted_maps = []
+
+    for chain, weight in weighted_chains:
+        try:
+            weighted_maps.append((chain.prefixed_states(prefix), weight))
+        except MarkovStateError:
+            pass
+
+    if not weighted_maps:
+        raise MarkovStateError("No states begin with: {}".format(prefix))
+
+    return _combine(weighted_maps)
+
+
+class MixtureChain(object):
+    """A weighted blend of several MarkovChains of the same order.
+
+    Nothing is merged up front, the underlying chains are consulted as states
+    are asked for. Changing a weight or one of the underlying chains takes
+    effect without rebuilding anything, though iterators that already exist
+    hold onto the weights they were created with.
+    """
+
+    def __init__(self, chains, weights=None):
+        chains = tuple(chains)
+
+        if not chains:
+            raise MarkovError("{} needs at least one chain".format(self.__class__.__name__))
+
+        if not isinstance(chains[0], MarkovChain):
+            raise MarkovError("chains must all be MarkovChains of the same order")
+
+        # MarkovChain equality is order compatibility
+        if any(chain != chains[0] for chain in chains):
+            raise MarkovError("chains must all be MarkovChains of the same order")
+
+        self._chains = chains
+        self.weights = weights if weights is not None else [1] * len(chains)
+
+    def __repr__(self):
+        return "{}(order={}, chains={})".format(
+            self.__class__.__name__, self.order, len(self.chains)
+        )
+
+    @property
+    def order(self):
+        """Order of the mixture, shared by every chain in it"""
+        return self._chains[0].order
+
+    @property
+    def chains(self):
+        """The blended chains, in the same order as their weights"""
+        return self._chains
+
+    @property
+    def weights(self):
+        """Weight of each chain in the mixture.
+
+        May be replaced with a new sequence of non-negative numbers, one
+        per chain, at least one of which is positive.
+        """
+
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights):
+        weights = tuple(weights)
+
+        if len(weights) != len(self._chains):
+            raise TypeError("weights must be of length {}".format(len(self._chains)))
+
+        if any(weight < 0 for weight in weights):
+            raise ValueError("weights must not be negative")
+
+        if not any(weights):
+            raise ValueError("at least one weight must be positive")
+
+        self._weights = weights
+
+    def _weighted_chains(self):
+        """Pairs each chain with its weight, leaving out chains that can't
+        contribute to the mixture.
+        """
+
+        return [(chain, weight) for chain, weight in zip(self._chains, self._weights) if weight]
+
+    def __iter__(self):
+        """Return a default MixtureChainIterator.
+
+        If optional arguments needs to be passed to iterator,
+        use :method:`MixtureChain.iterate_chain`
+        """
+        return MixtureChainIterator(chain=self)
+
+    def __getitem__(self, state):
+        """Returns the blended possible states for state as a new
+        ProbablityMap.
+        """
+
+        if not isinstance(state, tuple):
+            state = (state,)
+
+        weighted_maps = [
+            (chain[state], weight)
+            for chain, weight in self._weighted_chains()
+            if state in chain
+        ]
+
+        if not weighted_maps:
+            raise MarkovStateError("Invalid state provided: {}".format(state))
+
+        return _combine(weighted_maps)
+
+    def __contains__(self, state):
+        return any(state in chain for chain, _ in self._weighted_chains())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def keys(self):
+        return set().union(*(chain.keys() for chain, _ in self._weighted_chains()))
+
+    def prefixed_states(self, prefix):
+        """Returns a ProbablityMap of every state beginning with prefix,
+        valued by the weighted number of times each state was seen.
+
+        If no state begins with prefix, a MarkovStateError is raised.
+        """
+
+        return _prefixed_states(self._weighted_chains(), prefix)
+
+    def iterate_chain(self, **kwargs):
+        """Allows passing arbitrary keyword arguments to the
+        MixtureChainIterator class for iteration.
+        """
+
+        return MixtureChainIterator(chain=self, **kwargs)
+
+
+class _MixtureChoosers(object):
+    """Stands in for the map of states to weighted random closures that
+    MarkovChainIterator builds, creating closures as states are asked for.
+
+    States that are asked for at least hot_after times have a closure over
+    their combined possible states cached, keeping at most cache_size of
+    them and discarding the least recently used. Visits are only counted
+    for the most recently seen cache_size * VISITS_PER_SLOT cold states.
+    """
+
+    VISITS_PER_SLOT = 4
+
+    def __init__(self, weighted_chains, randomizer, hot_after, cache_size):
+        self._weighted_chains = weighted_chains
+        self._randomizer = randomizer
+        self._hot_after = hot_after
+        self._cache_size = cache_size
+        self._visits = OrderedDict()
+        self._hot = OrderedDict()
+
+    def __contains__(self, state):
+        return any(state in chain for chain, _ in self._weighted_chains)
+
+    def prefixed_states(self, prefix):
+        return _prefixed_states(self._weighted_chains, prefix)
+
+    def random_state(self):
+        """Picks a chain by weight, skipping empty ones, and then a random
+        state from it rather than from every chain's states at once.
+        """
+
+        chooser = weighted_choice(
+            weight if len(chain) else 0 for chain, weight in self._weighted_chains
+        )
+        chain, _ = self._weighted_chains[chooser(self._randomizer())]
+        return random_key(chain)
+
+    def __getitem__(self, state):
+        if state in self._hot:
+            self._hot.move_to_end(state)
+            return self._hot[state]
+
+        weighted_maps = [
+            (chain[state], weight)
+            for chain, weight in self._weighted_chains
+            if state in chain
+        ]
+
+        if not weighted_maps:
+            raise MarkovStateError("Invalid state provided: {}".format(state))
+
+        visits = self._visits.pop(state, 0) + 1
+
+        if visits < self._hot_after:
+            self._visits[state] = visits
+            if len(self._visits) > self._cache_size * self.VISITS_PER_SLOT:
+                self._visits.popitem(last=False)
+            return self._component_chooser(weighted_maps)
+
+        chooser = self._hot[state] = _combine(weighted_maps).weighted_choice(self._randomizer)
+
+        if len(self._hot) > self._cache_size:
+            self._hot.popitem(last=False)
+
+        return chooser
+
+    def _component_chooser(self, weighted_maps):
+        """Returns a closure that picks one of the chains, in proportion
+        to its weight times how often it saw the state, and then draws
+        the next value from that chain alone.
+        """
+
+        randomizer = self._randomizer
+        chooser = weighted_choice(
+            weight * sum(possible.values()) for possible, weight in weighted_maps
+        )
+
+        # unlike ProbablityMap.weighted_choice, these skip sorting the
+        # possible states as each closure is only good for a single visit
+        components = []
+        for possible, _ in weighted_maps:
+            values, counts = unzip(possible.items()) if possible else ((), ())
+            components.append((values, weighted_choice(counts)))
+
+        def random_item():
+            values, component = components[chooser(randomizer())]
+            return values[component(randomizer())]
+
+        return random_item
+
+
+class MixtureChainIterator(MarkovChainIterator):
+    """Iteration handler for MixtureChains.
+
+    Unlike MarkovChainIterator, no copy of the chains is made. Each step
+    reads the current state from the underlying chains, so changes to them
+    show through, except in states that have become hot and have their
+    combined closure cached.
+
+    Like MarkovChainIterator, this is a non-deterministic, possibly
+    cyclical iterator.
+    """
+
+    def __init__(self, chain, randomizer=random, begin_at=None,
+                 hot_after=8, cache_size=256, **kwargs):
+        """Set initial state of the iterator.
+
+        * chain: MixtureChain or subclass to iterate
+        * randomizer: function to generate floats 0 <= n < 1
+        defaults to random.random
+        * begin_at: known state, or prefix of one, to place the iterator in
+        * hot_after: number of visits after which a state's combined
+        closure is cached
+        * cache_size: most combined closures to keep at once
+        """
+
+        self._hot_after = hot_after
+        self._cache_size = cache_size
+        super().__init__(chain, randomizer=randomizer, begin_at=begin_at, **kwargs)
+
+    def _build_prefixed_states(self, chain):
+        """Looks up prefixed states with the weights the iterator was
+        created with rather than the mixture's current ones.
+        """
+
+        return self._chain.prefixed_states
+
+    def _random_state(self):
+        "Puts the chain into a random state."
+
+        self.state = self._chain.random_state()
+
+    def _build_chain(self, chain):
+        """Snapshots the mixture's weights, deferring every closure
+        until its state is reached.
+        """
+
+        return _MixtureChoosers(
+            chain._weighted_chains(), self._randomizer,
+            self._hot_after, self._cache_size
+        )
@@ -9,7 +9,7 @@ from random import choice, random
 __all__ = (
     "window", "weighted_choice", "unzip",
     "patch_return_type", "weighted_choice_on_map", "random_key",
-    "head", "last", "groupby"
+    "head", "last", "groupby", "prefixes"
 )
 
 
@@ -132,5 +132,15 @@ def groupby(seq, key):
     return {k: v.__self__ for k, v in d.items()}
 
 
+def prefixes(state):
+    """Yields every proper, non-empty prefix of a state, shortest first.
+
+    ('a', 'b', 'c') -> ('a',), ('a', 'b')
+    """
+
+    for i in range(1, len(state)):
+        yield state[:i]
+
+
 head = itemgetter(slice(-1))
 last = itemgetter(-1)
@@ -130,3 +130,69 @@ def test_MarkovChain_delitem_raises():
         del chain.MarkovChain(order=2)['', '']
 
     assert 'disjoint' in str(err.value)
+
+
+def test_MarkovChain_prefixed_states():
+    corpus = 'the cat sat the cat ran the dog sat down'.split()
+    mc = chain.MarkovChain.from_corpus(corpus, order=3)
+
+    assert mc.prefixed_states('the') == {('the', 'cat', 'sat'): 1,
+                                         ('the', 'cat', 'ran'): 1,
+                                         ('the', 'dog', 'sat'): 1}
+    assert mc.prefixed_states(('the', 'cat')) == {('the', 'cat', 'sat'): 1,
+                                                  ('the', 'cat', 'ran'): 1}
+    assert mc.prefixed_states(('cat', 'sat', 'the')) == {('cat', 'sat', 'the'): 1}
+
+
+def test_MarkovChain_prefixed_states_tracks_updates():
+    mc = chain.MarkovChain(order=2, states={('a', 'b'): {'c': 1}})
+    mc[('a', 'b')] = {'c': 3, 'd': 2}
+    mc[('a', 'c')] = {'d': 1}
+
+    assert mc.prefixed_states('a') == {('a', 'b'): 5, ('a', 'c'): 1}
+
+
+@pytest.mark.parametrize('prefix', ['z', ('a', 'z'), ('a', 'b', 'c')])
+def test_MarkovChain_prefixed_states_raises_when_missing(prefix):
+    mc = chain.MarkovChain(order=2, states={('a', 'b'): {'c': 1}})
+
+    with pytest.raises(chain.MarkovStateError):
+        mc.prefixed_states(prefix)
+
+
+def test_MarkovChainIterator_begin_at_prefix():
+    corpus = 'the cat sat the cat ran the dog sat down'.split()
+    mc = chain.MarkovChain.from_corpus(corpus, order=3)
+
+    mci = mc.iterate_chain(begin_at=('the', 'dog'))
+    assert mci.state == ('the', 'dog', 'sat')
+
+    mci.reset(begin_at='cat')
+    assert mci.state[0] == 'cat'
+
+
+def test_MarkovChainIterator_begin_at_prefix_weighted():
+    mc = chain.MarkovChain(order=2, states={('a', 'b'): {'c': 1},
+                                            ('a', 'c'): {'b': 9}})
+
+    assert mc.iterate_chain(begin_at='a', randomizer=lambda: 0.5).state == ('a', 'c')
+    assert mc.iterate_chain(begin_at='a', randomizer=lambda: 0).state == ('a', 'b')
+
+
+def test_MarkovChain_prefixed_states_tracks_counts_in_place():
+    mc = chain.MarkovChain(order=2, states={('a', 'b'): {'c': 1},
+                                            ('a', 'c'): {'d': 1}})
+    mc[('a', 'b')]['c'] += 99
+    del mc.data[('a', 'c')]
+
+    assert mc.prefixed_states('a') == {('a', 'b'): 100}
+
+
+def test_MarkovChainIterator_begin_at_prefix_ignores_new_states():
+    mc = chain.MarkovChain(order=2, states={('a', 'b'): {'a': 1},
+                                            ('b', 'a'): {'b': 1}})
+    mci = mc.iterate_chain()
+    mc[('b', 'c')] = {'d': 1}
+
+    mci.reset(begin_at='b')
+    assert mci.state == ('b', 'a')
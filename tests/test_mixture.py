@@ -0,0 +1,146 @@
+import pytest
+from pykovy import chain, mixture
+
+
+def make_chains():
+    tenant = chain.MarkovChain(order=1, states={('a',): {'b': 1},
+                                                ('b',): {'a': 3}})
+    common = chain.MarkovChain(order=1, states={('a',): {'c': 2},
+                                                ('c',): {'a': 1}})
+    return tenant, common
+
+
+def test_MixtureChain():
+    tenant, common = make_chains()
+    mix = mixture.MixtureChain([tenant, common], weights=[3, 1])
+
+    assert mix.order == 1
+    assert mix.chains == (tenant, common)
+    assert mix.weights == (3, 1)
+    assert mixture.MixtureChain([tenant, common]).weights == (1, 1)
+
+
+def test_MixtureChain_raises_with_mismatched_orders():
+    with pytest.raises(chain.MarkovError) as err:
+        mixture.MixtureChain([chain.MarkovChain(order=1), chain.MarkovChain(order=2)])
+
+    assert 'same order' in str(err.value)
+
+
+def test_MixtureChain_raises_with_non_chains():
+    with pytest.raises(chain.MarkovError):
+        mixture.MixtureChain([{'a': 1}])
+
+
+def test_MixtureChain_raises_with_no_chains():
+    with pytest.raises(chain.MarkovError):
+        mixture.MixtureChain([])
+
+
+@pytest.mark.parametrize('weights, exc', [
+    ([1], TypeError),
+    ([1, -1], ValueError),
+    ([0, 0], ValueError),
+])
+def test_MixtureChain_raises_with_bad_weights(weights, exc):
+    with pytest.raises(exc):
+        mixture.MixtureChain(make_chains(), weights=weights)
+
+
+def test_MixtureChain_getitem():
+    mix = mixture.MixtureChain(make_chains(), weights=[3, 1])
+
+    assert mix['a'] == {'b': 3, 'c': 2}
+    assert isinstance(mix['a'], chain.ProbablityMap)
+
+    with pytest.raises(chain.MarkovStateError):
+        mix['z']
+
+
+def test_MixtureChain_zero_weight_hides_chain():
+    mix = mixture.MixtureChain(make_chains(), weights=[1, 0])
+
+    assert ('c',) not in mix
+    assert mix.keys() == {('a',), ('b',)}
+    assert mix['a'] == {'b': 1}
+
+    mix.weights = [1, 1]
+    assert ('c',) in mix
+    assert len(mix) == 3
+
+
+def test_MixtureChain_prefixed_states():
+    tenant = chain.MarkovChain(order=2, states={('a', 'b'): {'c': 1}})
+    common = chain.MarkovChain(order=2, states={('a', 'c'): {'b': 2},
+                                                ('b', 'a'): {'b': 1}})
+    mix = mixture.MixtureChain([tenant, common], weights=[2, 1])
+
+    assert mix.prefixed_states('a') == {('a', 'b'): 2, ('a', 'c'): 2}
+
+    with pytest.raises(chain.MarkovStateError):
+        mix.prefixed_states('z')
+
+
+def test_MixtureChain_iter():
+    mix = mixture.MixtureChain(make_chains())
+    assert isinstance(iter(mix), mixture.MixtureChainIterator)
+
+
+def test_MixtureChainIterator_picks_component_by_weighted_mass():
+    # tenant has mass 1 and common has mass 2 in ('a',)
+    mix = mixture.MixtureChain(make_chains(), weights=[3, 1])
+
+    assert next(mix.iterate_chain(begin_at=('a',), randomizer=lambda: 0.5)) == 'b'
+    assert next(mix.iterate_chain(begin_at=('a',), randomizer=lambda: 0.7)) == 'c'
+
+
+def test_MixtureChainIterator_caches_hot_states():
+    mix = mixture.MixtureChain(make_chains())
+    mci = mix.iterate_chain(begin_at=('a',), hot_after=2, cache_size=1)
+
+    assert not mci._chain._hot
+    mci.reset(begin_at=('a',))
+    assert list(mci._chain._hot) == [('a',)]
+
+    mci.reset(begin_at=('b',))
+    mci.reset(begin_at=('b',))
+    assert list(mci._chain._hot) == [('b',)]
+
+
+def test_MixtureChainIterator_sees_chain_updates():
+    tenant, common = make_chains()
+    mci = mixture.MixtureChain([tenant, common]).iterate_chain(begin_at=('c',))
+
+    assert next(mci) == 'a'
+    common[('c',)] = {'b': 1}
+    mci.reset(begin_at=('c',))
+    assert next(mci) == 'b'
+
+
+def test_MixtureChainIterator_prefixes_use_creation_weights():
+    mix = mixture.MixtureChain(make_chains(), weights=[1, 0])
+    mci = mix.iterate_chain()
+    mix.weights = [0, 1]
+
+    mci.reset(begin_at='a')
+    assert mci.state == ('a',)
+    assert next(mci) == 'b'
+
+    mci.reset(begin_at='c')
+    assert mci.state in {('a',), ('b',)}
+
+
+def test_MixtureChainIterator_random_state_picks_chain_by_weight():
+    mix = mixture.MixtureChain(make_chains(), weights=[0, 1])
+
+    for _ in range(10):
+        assert mix.iterate_chain().state in {('a',), ('c',)}
+
+
+def test_MixtureChainIterator_bounds_visit_counts():
+    states = {(str(i),): {str(i + 1): 1} for i in range(50)}
+    mix = mixture.MixtureChain([chain.MarkovChain(order=1, states=states)])
+    mci = mix.iterate_chain(begin_at=('0',), cache_size=2)
+
+    assert list(mci) == [str(i) for i in range(1, 51)]
+    assert len(mci._chain._visits) == 2 * mci._chain.VISITS_PER_SLOT
@@ -64,3 +64,7 @@ def test_patch_return_type():
     added_my_counter = MyCounter('aab') + MyCounter('bba')
     assert isinstance(added_my_counter, MyCounter)
     assert added_my_counter == {'a': 3, 'b': 3}
+
+
+def test_prefixes():
+    assert list(utils.prefixes((1, 2, 3))) == [(1,), (1, 2)]